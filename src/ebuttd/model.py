@@ -1,12 +1,14 @@
+import functools
 import math
+import operator
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import NamedTuple, TypedDict
+from typing import Iterable, NamedTuple, Sequence, TypedDict
 
 
 def split_value(value: str) -> list[str]:
-    return [v for v in value.strip().split(" ") if v]
+    return value.split()
 
 
 class Unit(Enum):
@@ -14,18 +16,38 @@ class Unit(Enum):
     PERCENT = "%"
 
     def parse(self, value: str, /, max_value: float | None = None) -> float:
-        v = value.strip()
-        suffix = "c" if self == Unit.CELL else "%"
-        if not v or v[-1] != suffix:
-            raise ValueError(value)
-        n = float(v[:-1])
-        if not math.isfinite(n) or n < 0.0:
+        if self is Unit.CELL:
+            return _parse_cell(value, max_value)
+        return _parse_percent(value, max_value)
+
+
+_POS_INF = math.inf
+
+
+def _parse_cell(value: str, max_value: float | None = None) -> float:
+    v = value.strip()
+    if not v.endswith("c"):
+        raise ValueError(value)
+    n = float(v[:-1])
+    if max_value is None:
+        if not (0.0 <= n < _POS_INF):
             raise ValueError(value)
-        if max_value is not None and n > max_value:
+    elif not (0.0 <= n <= max_value):
+        raise ValueError(value)
+    return n
+
+
+def _parse_percent(value: str, max_value: float | None = None) -> float:
+    v = value.strip()
+    if not v.endswith("%"):
+        raise ValueError(value)
+    n = float(v[:-1])
+    if max_value is None:
+        if not (0.0 <= n < _POS_INF):
             raise ValueError(value)
-        if self == Unit.CELL:
-            return n
-        return n / 100.0
+    elif not (0.0 <= n <= max_value):
+        raise ValueError(value)
+    return n / 100.0
 
 
 class ActiveArea(NamedTuple):
@@ -40,10 +62,10 @@ class ActiveArea(NamedTuple):
         if len(values) != 4:
             raise ValueError(value)
         return ActiveArea(
-            left=Unit.PERCENT.parse(values[0], max_value=100.0),
-            top=Unit.PERCENT.parse(values[1], max_value=100.0),
-            width=Unit.PERCENT.parse(values[2], max_value=100.0),
-            height=Unit.PERCENT.parse(values[3], max_value=100.0),
+            left=_parse_percent(values[0], max_value=100.0),
+            top=_parse_percent(values[1], max_value=100.0),
+            width=_parse_percent(values[2], max_value=100.0),
+            height=_parse_percent(values[3], max_value=100.0),
         )
 
 
@@ -72,46 +94,49 @@ class Color(NamedTuple):
     alpha: int
 
     def is_valid(self) -> bool:
-        return (
-            self.red >= 0
-            and self.red <= 255
-            and self.green >= 0
-            and self.green <= 255
-            and self.blue >= 0
-            and self.blue <= 255
-            and self.alpha >= 0
-            and self.alpha <= 255
-        )
+        return 0 <= min(self) and max(self) <= 255
 
     @staticmethod
     def black() -> "Color":
-        return Color(red=0, green=0, blue=0, alpha=255)
+        return _BLACK
 
     @staticmethod
     def white() -> "Color":
-        return Color(red=255, green=255, blue=255, alpha=255)
+        return _WHITE
 
     @staticmethod
     def transparent() -> "Color":
-        return Color(red=0, green=0, blue=0, alpha=0)
+        return _TRANSPARENT
 
     @staticmethod
     def parse(value: str) -> "Color":
-        v = value.strip()
-        if not v or v[0] != "#":
-            raise ValueError(value)
-        v = v[1:]
-        if len(v) != 6 and len(v) != 8:
-            raise ValueError(value)
-        color = Color(
-            red=int(v[0:2], base=16),
-            green=int(v[2:4], base=16),
-            blue=int(v[4:6], base=16),
-            alpha=int(v[6:8], base=16) if len(v) == 8 else 0,
-        )
-        if color.is_valid():
-            return color
-        raise ValueError(value)
+        return _parse_color(value.strip())
+
+
+_BLACK = Color(red=0, green=0, blue=0, alpha=255)
+_WHITE = Color(red=255, green=255, blue=255, alpha=255)
+_TRANSPARENT = Color(red=0, green=0, blue=0, alpha=0)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_color(v: str) -> Color:
+    if not v or v[0] != "#":
+        raise ValueError(v)
+    h = v[1:]
+    if len(h) != 6 and len(h) != 8:
+        raise ValueError(v)
+    try:
+        b = bytes.fromhex(h)
+    except ValueError:
+        raise ValueError(v) from None
+    if len(b) * 2 != len(h):
+        raise ValueError(v)
+    return Color(
+        red=b[0],
+        green=b[1],
+        blue=b[2],
+        alpha=b[3] if len(b) == 4 else 0,
+    )
 
 
 class Direction(Enum):
@@ -120,13 +145,13 @@ class Direction(Enum):
 
     @staticmethod
     def parse(value: str) -> "Direction":
-        match value.strip():
-            case "ltr":
-                return Direction.LTR
-            case "rtl":
-                return Direction.RTL
-            case _:
-                raise ValueError(value)
+        try:
+            return _DIRECTION_LOOKUP[value.strip()]
+        except KeyError:
+            raise ValueError(value) from None
+
+
+_DIRECTION_LOOKUP: dict[str, Direction] = {m.value: m for m in Direction}
 
 
 class DisplayAlign(Enum):
@@ -136,15 +161,13 @@ class DisplayAlign(Enum):
 
     @staticmethod
     def parse(value: str) -> "DisplayAlign":
-        match value.strip():
-            case "before":
-                return DisplayAlign.BEFORE
-            case "center":
-                return DisplayAlign.CENTER
-            case "after":
-                return DisplayAlign.AFTER
-            case _:
-                raise ValueError(value)
+        try:
+            return _DISPLAY_ALIGN_LOOKUP[value.strip()]
+        except KeyError:
+            raise ValueError(value) from None
+
+
+_DISPLAY_ALIGN_LOOKUP: dict[str, DisplayAlign] = {m.value: m for m in DisplayAlign}
 
 
 class Extent(NamedTuple):
@@ -156,18 +179,16 @@ class Extent(NamedTuple):
         values = split_value(value)
         if not values or len(values) != 2:
             raise ValueError(value)
-        width = Unit.PERCENT.parse(values[0], max_value=100.0)
-        height = Unit.PERCENT.parse(values[1], max_value=100.0)
+        width = _parse_percent(values[0], max_value=100.0)
+        height = _parse_percent(values[1], max_value=100.0)
         return Extent(width=width, height=height)
 
 
-class FontSize(float):
-    def __new__(cls, value: float) -> "FontSize":
-        return super().__new__(cls, value)
+FontSize = float
 
-    @staticmethod
-    def parse(value: str) -> "FontSize":
-        return FontSize(Unit.PERCENT.parse(value))
+
+def parse_font_size(value: str) -> FontSize:
+    return _parse_percent(value)
 
 
 class FontStyle(Enum):
@@ -176,13 +197,13 @@ class FontStyle(Enum):
 
     @staticmethod
     def parse(value: str) -> "FontStyle":
-        match value.strip():
-            case "normal":
-                return FontStyle.NORMAL
-            case "italic":
-                return FontStyle.ITALIC
-            case _:
-                raise ValueError(value)
+        try:
+            return _FONT_STYLE_LOOKUP[value.strip()]
+        except KeyError:
+            raise ValueError(value) from None
+
+
+_FONT_STYLE_LOOKUP: dict[str, FontStyle] = {m.value: m for m in FontStyle}
 
 
 class FontWeight(Enum):
@@ -191,34 +212,30 @@ class FontWeight(Enum):
 
     @staticmethod
     def parse(value: str) -> "FontWeight":
-        match value.strip():
-            case "normal":
-                return FontWeight.NORMAL
-            case "bold":
-                return FontWeight.BOLD
-            case _:
-                raise ValueError(value)
+        try:
+            return _FONT_WEIGHT_LOOKUP[value.strip()]
+        except KeyError:
+            raise ValueError(value) from None
 
 
-class LineHeight(float):
-    def __new__(cls, value: float) -> "LineHeight":
-        return super().__new__(cls, value)
+_FONT_WEIGHT_LOOKUP: dict[str, FontWeight] = {m.value: m for m in FontWeight}
 
-    @staticmethod
-    def parse(value: str) -> "LineHeight | None":
-        value = value.strip()
-        if value == "normal":
-            return None
-        return LineHeight(Unit.PERCENT.parse(value))
 
+LineHeight = float
 
-class LinePadding(float):
-    def __new__(cls, value: float) -> "LinePadding":
-        return super().__new__(cls, value)
 
-    @staticmethod
-    def parse(value: str) -> "LinePadding":
-        return LinePadding(Unit.CELL.parse(value))
+def parse_line_height(value: str) -> LineHeight | None:
+    value = value.strip()
+    if value == "normal":
+        return None
+    return _parse_percent(value)
+
+
+LinePadding = float
+
+
+def parse_line_padding(value: str) -> LinePadding:
+    return _parse_cell(value)
 
 
 class MultiRowAlign(Enum):
@@ -229,17 +246,13 @@ class MultiRowAlign(Enum):
 
     @staticmethod
     def parse(value: str) -> "MultiRowAlign":
-        match value.strip():
-            case "auto":
-                return MultiRowAlign.AUTO
-            case "start":
-                return MultiRowAlign.START
-            case "center":
-                return MultiRowAlign.CENTER
-            case "end":
-                return MultiRowAlign.END
-            case _:
-                raise ValueError(value)
+        try:
+            return _MULTI_ROW_ALIGN_LOOKUP[value.strip()]
+        except KeyError:
+            raise ValueError(value) from None
+
+
+_MULTI_ROW_ALIGN_LOOKUP: dict[str, MultiRowAlign] = {m.value: m for m in MultiRowAlign}
 
 
 class Origin(NamedTuple):
@@ -251,8 +264,8 @@ class Origin(NamedTuple):
         values = split_value(value)
         if len(values) != 2:
             raise ValueError(value)
-        x = Unit.PERCENT.parse(values[0], max_value=100.0)
-        y = Unit.PERCENT.parse(values[1], max_value=100.0)
+        x = _parse_percent(values[0], max_value=100.0)
+        y = _parse_percent(values[1], max_value=100.0)
         return Origin(x=x, y=y)
 
 
@@ -262,13 +275,13 @@ class Overflow(Enum):
 
     @staticmethod
     def parse(value: str) -> "Overflow":
-        match value.strip():
-            case "hidden":
-                return Overflow.HIDDEN
-            case "visible":
-                return Overflow.VISIBLE
-            case _:
-                raise ValueError(value)
+        try:
+            return _OVERFLOW_LOOKUP[value.strip()]
+        except KeyError:
+            raise ValueError(value) from None
+
+
+_OVERFLOW_LOOKUP: dict[str, Overflow] = {m.value: m for m in Overflow}
 
 
 class Padding(NamedTuple):
@@ -282,25 +295,15 @@ class Padding(NamedTuple):
         values = split_value(value)
         if not values or len(values) > 3:
             raise ValueError(value)
-        before = 0.0
-        end = 0.0
-        after = 0.0
-        start = 0.0
-        for i, v in enumerate(values):
-            length = Unit.PERCENT.parse(v)
-            match i:
-                case 0:
-                    before = length
-                    end = length
-                    after = length
-                    start = length
-                case 1:
-                    end = length
-                    start = length
-                case 2:
-                    after = length
-                case _:
-                    start = length
+        before = _parse_percent(values[0])
+        if len(values) == 1:
+            end = after = start = before
+        elif len(values) == 2:
+            after = before
+            end = start = _parse_percent(values[1])
+        else:
+            end = start = _parse_percent(values[1])
+            after = _parse_percent(values[2])
         return Padding(before=before, end=end, after=after, start=start)
 
 
@@ -310,13 +313,15 @@ class ShowBackground(Enum):
 
     @staticmethod
     def parse(value: str) -> "ShowBackground":
-        match value.strip():
-            case "always":
-                return ShowBackground.ALWAYS
-            case "whenActive":
-                return ShowBackground.WHEN_ACTIVE
-            case _:
-                raise ValueError(value)
+        try:
+            return _SHOW_BACKGROUND_LOOKUP[value.strip()]
+        except KeyError:
+            raise ValueError(value) from None
+
+
+_SHOW_BACKGROUND_LOOKUP: dict[str, ShowBackground] = {
+    m.value: m for m in ShowBackground
+}
 
 
 class TextAlign(Enum):
@@ -328,19 +333,13 @@ class TextAlign(Enum):
 
     @staticmethod
     def parse(value: str) -> "TextAlign":
-        match value.strip():
-            case "left":
-                return TextAlign.LEFT
-            case "center":
-                return TextAlign.CENTER
-            case "right":
-                return TextAlign.RIGHT
-            case "start":
-                return TextAlign.START
-            case "end":
-                return TextAlign.END
-            case _:
-                raise ValueError(value)
+        try:
+            return _TEXT_ALIGN_LOOKUP[value.strip()]
+        except KeyError:
+            raise ValueError(value) from None
+
+
+_TEXT_ALIGN_LOOKUP: dict[str, TextAlign] = {m.value: m for m in TextAlign}
 
 
 class TextDecoration(Enum):
@@ -349,13 +348,15 @@ class TextDecoration(Enum):
 
     @staticmethod
     def parse(value: str) -> "TextDecoration":
-        match value.strip():
-            case "none":
-                return TextDecoration.NONE
-            case "underline":
-                return TextDecoration.UNDERLINE
-            case _:
-                raise ValueError(value)
+        try:
+            return _TEXT_DECORATION_LOOKUP[value.strip()]
+        except KeyError:
+            raise ValueError(value) from None
+
+
+_TEXT_DECORATION_LOOKUP: dict[str, TextDecoration] = {
+    m.value: m for m in TextDecoration
+}
 
 
 class TextOutline(NamedTuple):
@@ -373,15 +374,16 @@ class TextOutline(NamedTuple):
         if len(values) > 3:
             raise ValueError(value)
         color = None
+        i = 0
         if values[0].startswith("#"):
             if len(values) == 1:
                 raise ValueError(value)
             color = Color.parse(values[0])
-            values = values[1:]
-        thickness = Unit.PERCENT.parse(values[0])
+            i = 1
+        thickness = _parse_percent(values[i])
         blur_radius = None
-        if len(values) > 1:
-            blur_radius = Unit.PERCENT.parse(values[1])
+        if len(values) > i + 1:
+            blur_radius = _parse_percent(values[i + 1])
         return TextOutline(color=color, thickness=thickness, blur_radius=blur_radius)
 
 
@@ -391,13 +393,13 @@ class Space(Enum):
 
     @staticmethod
     def parse(value: str) -> "Space":
-        match value.strip():
-            case "default":
-                return Space.DEFAULT
-            case "preserve":
-                return Space.PRESERVE
-            case _:
-                raise ValueError(value)
+        try:
+            return _SPACE_LOOKUP[value.strip()]
+        except KeyError:
+            raise ValueError(value) from None
+
+
+_SPACE_LOOKUP: dict[str, Space] = {m.value: m for m in Space}
 
 
 class UnicodeBidi(Enum):
@@ -407,15 +409,13 @@ class UnicodeBidi(Enum):
 
     @staticmethod
     def parse(value: str) -> "UnicodeBidi":
-        match value.strip():
-            case "normal":
-                return UnicodeBidi.NORMAL
-            case "embed":
-                return UnicodeBidi.EMBED
-            case "bidiOverride":
-                return UnicodeBidi.BIDI_OVERRIDE
-            case _:
-                raise ValueError(value)
+        try:
+            return _UNICODE_BIDI_LOOKUP[value.strip()]
+        except KeyError:
+            raise ValueError(value) from None
+
+
+_UNICODE_BIDI_LOOKUP: dict[str, UnicodeBidi] = {m.value: m for m in UnicodeBidi}
 
 
 class WrapOption(Enum):
@@ -424,13 +424,13 @@ class WrapOption(Enum):
 
     @staticmethod
     def parse(value: str) -> "WrapOption":
-        match value.strip():
-            case "wrap":
-                return WrapOption.WRAP
-            case "noWrap":
-                return WrapOption.NO_WRAP
-            case _:
-                raise ValueError(value)
+        try:
+            return _WRAP_OPTION_LOOKUP[value.strip()]
+        except KeyError:
+            raise ValueError(value) from None
+
+
+_WRAP_OPTION_LOOKUP: dict[str, WrapOption] = {m.value: m for m in WrapOption}
 
 
 class WritingMode(Enum):
@@ -441,37 +441,41 @@ class WritingMode(Enum):
 
     @staticmethod
     def parse(value: str) -> "WritingMode":
-        match value.strip():
-            case "lrtb" | "lr":
-                return WritingMode.LRTB
-            case "rltb" | "rl":
-                return WritingMode.RLTB
-            case "tbrl" | "tb":
-                return WritingMode.TBRL
-            case "tblr":
-                return WritingMode.TBLR
-            case _:
-                raise ValueError(value)
+        try:
+            return _WRITING_MODE_LOOKUP[value.strip()]
+        except KeyError:
+            raise ValueError(value) from None
+
+
+_WRITING_MODE_LOOKUP: dict[str, WritingMode] = {
+    **{m.value: m for m in WritingMode},
+    "lr": WritingMode.LRTB,
+    "rl": WritingMode.RLTB,
+    "tb": WritingMode.TBRL,
+}
 
 
 class Br:
     pass
 
 
-def default_font_family() -> list[str]:
-    return ["default"]
+_DEFAULT_FONT_FAMILY = ("default",)
+
 
+def default_font_family() -> Sequence[str]:
+    return _DEFAULT_FONT_FAMILY
 
-@dataclass
+
+@dataclass(slots=True)
 class Span:
     id: str = ""
     language: str = ""
     space: Space = Space.DEFAULT
-    background_color: Color = Color.transparent()
-    color: Color = Color.white()
+    background_color: Color = _TRANSPARENT
+    color: Color = _WHITE
     direction: Direction = Direction.LTR
-    font_family: list[str] = field(default_factory=default_font_family)
-    font_size: FontSize = FontSize(1.0)
+    font_family: Sequence[str] = _DEFAULT_FONT_FAMILY
+    font_size: FontSize = 1.0
     font_style: FontStyle = FontStyle.NORMAL
     font_weight: FontWeight = FontWeight.NORMAL
     text_decoration: TextDecoration = TextDecoration.NONE
@@ -481,7 +485,7 @@ class Span:
     text: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Paragraph:
     id: str = ""
     begin_secs: float = 0.0
@@ -489,32 +493,32 @@ class Paragraph:
     region_index: int = 0
     language: str = ""
     space: Space = Space.DEFAULT
-    background_color: Color = Color.transparent()
+    background_color: Color = _TRANSPARENT
     direction: Direction = Direction.LTR
     fill_line_gap: bool = False
     line_height: LineHeight | None = None
-    line_padding: LinePadding = LinePadding(0.0)
+    line_padding: LinePadding = 0.0
     multi_row_align: MultiRowAlign = MultiRowAlign.AUTO
     text_align: TextAlign = TextAlign.START
     unicode_bidi: UnicodeBidi = UnicodeBidi.NORMAL
     contents: list[Br | Span] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Div:
     id: str = ""
     language: str = ""
-    background_color: Color = Color.transparent()
+    background_color: Color = _TRANSPARENT
     paragraphs: list[Paragraph] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Body:
-    background_color: Color = Color.transparent()
+    background_color: Color = _TRANSPARENT
     divs: list[Div] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Region:
     origin: Origin = Origin()
     extent: Extent = Extent()
@@ -525,7 +529,7 @@ class Region:
     writing_mode: WritingMode = WritingMode.LRTB
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     active_area: ActiveArea = ActiveArea()
     cell_resolution: CellResolution = CellResolution()
@@ -566,19 +570,45 @@ COMPUTE_ALL_MASK = (
     | COMPUTE_TEXT_OUTLINE_BIT
 )
 
-
-@dataclass
+_PROPERTY_MASK_BITS = {
+    "background_color": 0,
+    "color": 0,
+    "direction": 0,
+    "fill_line_gap": 0,
+    "font_family": 0,
+    "font_size": COMPUTE_FONT_SIZE_BIT,
+    "font_style": 0,
+    "font_weight": 0,
+    "line_height": COMPUTE_LINE_HEIGHT_BIT,
+    "line_padding": COMPUTE_LINE_PADDING_BIT,
+    "multi_row_align": 0,
+    "text_align": 0,
+    "text_decoration": 0,
+    "text_outline": COMPUTE_TEXT_OUTLINE_BIT,
+    "unicode_bidi": 0,
+    "wrap_option": 0,
+}
+
+
+def style_properties_mask(properties: StyleProperties) -> int:
+    mask = 0
+    for name in properties:
+        mask |= _PROPERTY_MASK_BITS[name]
+    return mask
+
+
+@dataclass(slots=True)
 class ResolvedStyle:
-    background_color: Color = Color.transparent()
-    color: Color = Color.white()
+    background_color: Color = _TRANSPARENT
+    color: Color = _WHITE
     direction: Direction = Direction.LTR
     fill_line_gap: bool = False
-    font_family: list[str] = field(default_factory=default_font_family)
-    font_size: FontSize = FontSize(1.0)
+    font_family: Sequence[str] = _DEFAULT_FONT_FAMILY
+    font_size: FontSize = 1.0
     font_style: FontStyle = FontStyle.NORMAL
     font_weight: FontWeight = FontWeight.NORMAL
     line_height: LineHeight | None = None
-    line_padding: LinePadding = LinePadding(0.0)
+    line_padding: LinePadding = 0.0
     multi_row_align: MultiRowAlign = MultiRowAlign.AUTO
     text_align: TextAlign = TextAlign.START
     text_decoration: TextDecoration = TextDecoration.NONE
@@ -593,70 +623,62 @@ class ResolvedStyle:
         cell_resolution: CellResolution,
     ) -> None:
         compute_font_size = (mask & COMPUTE_FONT_SIZE_BIT) != 0
+        font_size = self.font_size
         if compute_font_size:
             if parent_font_size is None:
-                self.font_size = FontSize(self.font_size * 1.0 / cell_resolution.rows)
+                font_size = font_size * 1.0 / cell_resolution.rows
             else:
-                self.font_size = FontSize(self.font_size * parent_font_size)
+                font_size = font_size * parent_font_size
+            self.font_size = font_size
         if compute_font_size or (mask & COMPUTE_LINE_HEIGHT_BIT) != 0:
-            if self.line_height is not None:
-                self.line_height = LineHeight(self.line_height * self.font_size)
+            if (line_height := self.line_height) is not None:
+                self.line_height = line_height * font_size
         if (mask & COMPUTE_LINE_PADDING_BIT) != 0:
-            self.line_padding = LinePadding(
-                self.line_padding * 1.0 / cell_resolution.columns
-            )
+            self.line_padding = self.line_padding * 1.0 / cell_resolution.columns
         if compute_font_size or (mask & COMPUTE_TEXT_OUTLINE_BIT) != 0:
-            if self.text_outline is not None:
-                outline = self.text_outline
-                thickness = outline.thickness * self.font_size
+            if (outline := self.text_outline) is not None:
+                thickness = outline.thickness * font_size
                 if outline.blur_radius is None:
                     blur_radius = None
                 else:
-                    blur_radius = outline.blur_radius * self.font_size
-                self.text_outline = self.text_outline._replace(
-                    thickness=thickness, blur_radius=blur_radius
-                )
+                    blur_radius = outline.blur_radius * font_size
+                self.text_outline = TextOutline(outline.color, thickness, blur_radius)
+
+    def copy(self) -> "ResolvedStyle":
+        return ResolvedStyle(*_RESOLVED_STYLE_VALUES(self))
+
+    def push(
+        self,
+        styles: Iterable[tuple[StyleProperties, int]],
+        cell_resolution: CellResolution,
+    ) -> "ResolvedStyle":
+        resolved_style = self.copy()
+        resolved_style.inherited()
+        for properties, mask in styles:
+            parent_font_size = resolved_style.font_size
+            resolved_style.assign_properties(properties)
+            resolved_style.compute(
+                mask=mask,
+                parent_font_size=parent_font_size,
+                cell_resolution=cell_resolution,
+            )
+        return resolved_style
 
     def inherited(self) -> None:
-        self.background_color = Color.transparent()
+        self.background_color = _TRANSPARENT
         self.unicode_bidi = UnicodeBidi.NORMAL
 
+    def assign_properties(self, properties: StyleProperties) -> None:
+        for name, v in properties.items():
+            if name == "font_family":
+                if not v:
+                    continue
+                v = tuple(v)
+            setattr(self, name, v)
+
     def merge_properties(self, properties: StyleProperties) -> int:
-        mask = 0
-        if v := properties.get("background_color"):
-            self.background_color = v
-        if v := properties.get("color"):
-            self.color = v
-        if v := properties.get("direction"):
-            self.direction = v
-        if v := properties.get("fill_line_gap"):
-            self.fill_line_gap = v
-        if v := properties.get("font_family"):
-            self.font_family = v.copy()
-        if v := properties.get("font_style"):
-            self.font_style = v
-        if v := properties.get("font_weight"):
-            self.font_weight = v
-        if v := properties.get("multi_row_align"):
-            self.multi_row_align = v
-        if v := properties.get("text_align"):
-            self.text_align = v
-        if v := properties.get("text_decoration"):
-            self.text_decoration = v
-        if v := properties.get("unicode_bidi"):
-            self.unicode_bidi = v
-        if v := properties.get("wrap_option"):
-            self.wrap_option = v
-        if "line_height" in properties:
-            self.line_height = properties["line_height"]
-            mask |= COMPUTE_LINE_HEIGHT_BIT
-        if "text_outline" in properties:
-            self.text_outline = properties["text_outline"]
-            mask |= COMPUTE_TEXT_OUTLINE_BIT
-        if v := properties.get("font_size"):
-            self.font_size = v
-            mask |= COMPUTE_FONT_SIZE_BIT
-        if v := properties.get("line_padding"):
-            self.line_padding = v
-            mask |= COMPUTE_LINE_PADDING_BIT
-        return mask
+        self.assign_properties(properties)
+        return style_properties_mask(properties)
+
+
+_RESOLVED_STYLE_VALUES = operator.attrgetter(*(f.name for f in fields(ResolvedStyle)))
@@ -1,10 +1,16 @@
 import functools
-import xml.etree.ElementTree as ET
+import io
+import re
+import sys
+
+from typing import Any, Callable, Iterator
 
-from collections import deque
+import xml.etree.ElementTree as ET
 
 from . import model
 
+USE_LXML = False
+
 XML_NS = "http://www.w3.org/XML/1998/namespace"
 
 TT_NS = "http://www.w3.org/ns/ttml"
@@ -65,31 +71,50 @@ P_ELEM = f"{{{TT_NS}}}p"
 BR_ELEM = f"{{{TT_NS}}}br"
 SPAN_ELEM = f"{{{TT_NS}}}span"
 
+TIMECODE_RE = re.compile(r"([0-9]+):([0-5][0-9]):([0-5][0-9])\.([0-9]{3})")
+
 
 class Context:
     document: model.Document
     ids: set[str]
-    styles: dict[str, model.StyleProperties]
+    styles: dict[str, tuple[model.StyleProperties, int]]
     regions: dict[str, tuple[int, str]]
+    resolved_styles: dict[tuple[str, ...], model.ResolvedStyle]
 
     def __init__(self, document: model.Document) -> None:
         self.document = document
         self.ids = set()
         self.styles = dict()
         self.regions = dict()
+        root_style = model.ResolvedStyle()
+        root_style.compute(
+            mask=model.COMPUTE_ALL_MASK,
+            parent_font_size=None,
+            cell_resolution=document.cell_resolution,
+        )
+        # The empty style stack resolves to the computed initial values.
+        self.resolved_styles = {(): root_style}
 
     def add_id(self, id: str) -> None:
-        if id in self.ids:
+        ids = self.ids
+        n = len(ids)
+        ids.add(id)
+        if len(ids) == n:
             raise ParseError(f"Non unique identifier: {id}")
-        self.ids.add(id)
 
 
 class ParseError(Exception):
     pass
 
 
-def parse(input: str) -> model.Document:
-    root = ET.fromstring(input)
+Events = Iterator[tuple[str, ET.Element]]
+
+
+def parse(input: str, use_lxml: bool | None = None) -> model.Document:
+    if use_lxml is None:
+        use_lxml = USE_LXML
+    events = _lxml_iterparse(input) if use_lxml else _iterparse(input)
+    _, root = next(events)
     if root.tag != TT_ELEM:
         raise ParseError(f"Invalid root element: {root.tag}")
     match root.get(TIME_BASE_ATTR):
@@ -109,40 +134,104 @@ def parse(input: str) -> model.Document:
     if v := root.get(SPACE_ATTR):
         document.space = model.Space.parse(v)
     ctx = Context(document)
-    _parse_head(root, ctx)
-    _parse_body(root, ctx)
+    head_count = 0
+    body_count = 0
+    depth = 0
+    for event, elem in events:
+        if event == "end":
+            depth -= 1
+            continue
+        if depth == 0 and elem.tag == HEAD_ELEM:
+            if head_count != 0:
+                raise ParseError("Multiple `head` elements")
+            head_count += 1
+            _skip_element(events)
+            _parse_head(elem, ctx)
+            elem.clear()
+            continue
+        if depth == 0 and elem.tag == BODY_ELEM:
+            if head_count == 0:
+                raise ParseError("Missing element `head`")
+            if body_count != 0:
+                raise ParseError("Multiple `body` elements")
+            body_count += 1
+            _parse_body(elem, events, ctx)
+            elem.clear()
+            continue
+        depth += 1
+    if head_count == 0:
+        raise ParseError("Missing element `head`")
+    if body_count == 0:
+        raise ParseError("Missing element `body`")
     return document
 
 
+def _iterparse(input: str) -> Events:
+    return ET.iterparse(io.StringIO(input), events=("start", "end"))
+
+
+_LXML_CHUNK_SIZE = 64 * 1024
+
+
+def _lxml_iterparse(input: str) -> Events:
+    from lxml import etree
+
+    # Match the stdlib parser: skip comments and processing instructions so
+    # element text is not cut short, and leave xml:id checks to _parse_id
+    # instead of libxml2. The input is already decoded, so ignore any
+    # declared encoding.
+    parser = etree.XMLPullParser(
+        events=("start", "end"),
+        encoding="utf-8",
+        remove_comments=True,
+        remove_pis=True,
+        collect_ids=False,
+        resolve_entities="internal",
+        no_network=True,
+    )
+    data = input.encode("utf-8")
+    for i in range(0, len(data), _LXML_CHUNK_SIZE):
+        parser.feed(data[i : i + _LXML_CHUNK_SIZE])
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+def _skip_element(events: Events) -> None:
+    """Consume events up to and including the end of the current element."""
+    depth = 0
+    for event, _ in events:
+        if event == "start":
+            depth += 1
+        elif depth == 0:
+            return
+        else:
+            depth -= 1
+
+
 def _parse_id(elem: ET.Element, required: bool = False) -> str:
     if v := elem.get(ID_ATTR):
         if s := v.strip():
-            return s
+            return sys.intern(s)
         raise ParseError(f"Empty `id` attribute on {elem.tag}")
     if required:
         raise ParseError(f"Missing `id` attribute on {elem.tag}")
     return ""
 
 
-def _parse_head(root: ET.Element, ctx: Context) -> None:
-    head, count = functools.reduce(
-        lambda acc, elem: (elem, acc[1] + 1), root.iterfind(HEAD_ELEM), (None, 0)
-    )
-    if head is None:
-        raise ParseError("Missing element `head`")
-    if count > 1:
-        raise ParseError("Multiple `head` elements")
+def _parse_head(head: ET.Element, ctx: Context) -> None:
     styling_count = 0
     layout_count = 0
     for elem in head:
-        if elem.tag == STYLING_ELEM:
+        tag = elem.tag
+        if tag == STYLING_ELEM:
             if styling_count != 0:
                 raise ParseError("Multiple `styling` elements")
             styling_count += 1
             _parse_styles(elem, ctx)
             if not ctx.styles:
                 raise ParseError("Missing element `style`")
-        elif elem.tag == LAYOUT_ELEM:
+        elif tag == LAYOUT_ELEM:
             if layout_count != 0:
                 raise ParseError("Multiple `layout` elements")
             layout_count += 1
@@ -155,312 +244,296 @@ def _parse_head(root: ET.Element, ctx: Context) -> None:
         raise ParseError("Missing element `layout`")
 
 
+def _parse_fill_line_gap(value: str) -> bool:
+    match value.strip():
+        case "true":
+            return True
+        case "false":
+            return False
+        case _:
+            raise ParseError(f"Invaid `fillLineGap` attribute: {value}")
+
+
+def _parse_font_family(value: str) -> list[str]:
+    return [v for v in value.strip().split(",") if v]
+
+
+STYLE_HANDLERS: dict[str, tuple[str, Callable[[str], Any]]] = {
+    BACKGROUND_COLOR_ATTR: ("background_color", model.Color.parse),
+    COLOR_ATTR: ("color", model.Color.parse),
+    DIRECTION_ATTR: ("direction", model.Direction.parse),
+    FILL_LINE_GAP_ATTR: ("fill_line_gap", _parse_fill_line_gap),
+    FONT_FAMILY_ATTR: ("font_family", _parse_font_family),
+    FONT_SIZE_ATTR: ("font_size", model.parse_font_size),
+    FONT_STYLE_ATTR: ("font_style", model.FontStyle.parse),
+    FONT_WEIGHT_ATTR: ("font_weight", model.FontWeight.parse),
+    LINE_HEIGHT_ATTR: ("line_height", model.parse_line_height),
+    LINE_PADDING_ATTR: ("line_padding", model.parse_line_padding),
+    MULTI_ROW_ALIGN_ATTR: ("multi_row_align", model.MultiRowAlign.parse),
+    TEXT_ALIGN_ATTR: ("text_align", model.TextAlign.parse),
+    TEXT_DECORATION_ATTR: ("text_decoration", model.TextDecoration.parse),
+    TEXT_OUTLINE_ATTR: ("text_outline", model.TextOutline.parse),
+    UNICODE_BIDI_ATTR: ("unicode_bidi", model.UnicodeBidi.parse),
+    WRAP_OPTION_ATTR: ("wrap_option", model.WrapOption.parse),
+}
+
+REGION_HANDLERS: dict[str, tuple[str, Callable[[str], Any]]] = {
+    ORIGIN_ATTR: ("origin", model.Origin.parse),
+    EXTENT_ATTR: ("extent", model.Extent.parse),
+    DISPLAY_ALIGN_ATTR: ("display_align", model.DisplayAlign.parse),
+    OVERFLOW_ATTR: ("overflow", model.Overflow.parse),
+    PADDING_ATTR: ("padding", model.Padding.parse),
+    SHOW_BACKGROUND_ATTR: ("show_background", model.ShowBackground.parse),
+    WRITING_MODE_ATTR: ("writing_mode", model.WritingMode.parse),
+}
+
+
 def _parse_styles(styling: ET.Element, ctx: Context) -> None:
-    for elem in styling:
-        if elem.tag != STYLE_ELEM:
-            continue
+    for elem in styling.iterfind(STYLE_ELEM):
         id = _parse_id(elem, required=True)
         ctx.add_id(id)
         properties = model.StyleProperties()
         for name, value in elem.items():
-            if name == BACKGROUND_COLOR_ATTR:
-                properties["background_color"] = model.Color.parse(value)
-            elif name == COLOR_ATTR:
-                properties["color"] = model.Color.parse(value)
-            elif name == DIRECTION_ATTR:
-                properties["direction"] = model.Direction.parse(value)
-            elif name == FILL_LINE_GAP_ATTR:
-                match value.strip():
-                    case "true":
-                        properties["fill_line_gap"] = True
-                    case "false":
-                        properties["fill_line_gap"] = False
-                    case _:
-                        raise ParseError(f"Invaid `fillLineGap` attribute: {value}")
-            elif name == FONT_FAMILY_ATTR:
-                properties["font_family"] = [v for v in value.strip().split(",") if v]
-            elif name == FONT_SIZE_ATTR:
-                properties["font_size"] = model.FontSize.parse(value)
-            elif name == FONT_STYLE_ATTR:
-                properties["font_style"] = model.FontStyle.parse(value)
-            elif name == FONT_WEIGHT_ATTR:
-                properties["font_weight"] = model.FontWeight.parse(value)
-            elif name == LINE_HEIGHT_ATTR:
-                properties["line_height"] = model.LineHeight.parse(value)
-            elif name == LINE_PADDING_ATTR:
-                properties["line_padding"] = model.LinePadding.parse(value)
-            elif name == MULTI_ROW_ALIGN_ATTR:
-                properties["multi_row_align"] = model.MultiRowAlign.parse(value)
-            elif name == TEXT_ALIGN_ATTR:
-                properties["text_align"] = model.TextAlign.parse(value)
-            elif name == TEXT_DECORATION_ATTR:
-                properties["text_decoration"] = model.TextDecoration.parse(value)
-            elif name == TEXT_OUTLINE_ATTR:
-                properties["text_outline"] = model.TextOutline.parse(value)
-            elif name == UNICODE_BIDI_ATTR:
-                properties["unicode_bidi"] = model.UnicodeBidi.parse(value)
-            elif name == WRAP_OPTION_ATTR:
-                properties["wrap_option"] = model.WrapOption.parse(value)
-        ctx.styles[id] = properties
+            if (handler := STYLE_HANDLERS.get(name)) is not None:
+                key, parse_value = handler
+                properties[key] = parse_value(value)
+        ctx.styles[id] = (properties, model.style_properties_mask(properties))
 
 
 def _parse_regions(layout: ET.Element, ctx: Context) -> None:
-    for elem in layout:
-        if elem.tag != REGION_ELEM:
-            continue
+    for elem in layout.iterfind(REGION_ELEM):
         id = _parse_id(elem, required=True)
         ctx.add_id(id)
         region = model.Region()
-        origin_parsed = False
-        extent_parsed = False
-        style = ""
         for name, value in elem.items():
-            if name == ORIGIN_ATTR:
-                region.origin = model.Origin.parse(value)
-                origin_parsed = True
-            elif name == EXTENT_ATTR:
-                region.extent = model.Extent.parse(value)
-                extent_parsed = True
-            elif name == "style":
-                style = value.strip()
-            elif name == DISPLAY_ALIGN_ATTR:
-                region.display_align = model.DisplayAlign.parse(value)
-            elif name == OVERFLOW_ATTR:
-                region.overflow = model.Overflow.parse(value)
-            elif name == PADDING_ATTR:
-                region.padding = model.Padding.parse(value)
-            elif name == SHOW_BACKGROUND_ATTR:
-                region.show_background = model.ShowBackground.parse(value)
-            elif name == WRITING_MODE_ATTR:
-                region.writing_mode = model.WritingMode.parse(value)
-        if not origin_parsed:
+            if (handler := REGION_HANDLERS.get(name)) is not None:
+                key, parse_value = handler
+                setattr(region, key, parse_value(value))
+        if elem.get(ORIGIN_ATTR) is None:
             raise ParseError("Missing `origin` attribute")
-        if not extent_parsed:
+        if elem.get(EXTENT_ATTR) is None:
             raise ParseError("Missing `extent` attribute")
+        style = elem.get("style", "").strip()
         ctx.regions[id] = (len(ctx.document.regions), style)
         ctx.document.regions.append(region)
 
 
-def _resolve_style(style_stack: deque[str], ctx: Context) -> model.ResolvedStyle:
-    resolved_style = model.ResolvedStyle()
-    resolved_style.compute(
-        mask=model.COMPUTE_ALL_MASK,
-        parent_font_size=None,
-        cell_resolution=ctx.document.cell_resolution,
-    )
-    parent_font_size = resolved_style.font_size
-    for index, value in enumerate(style_stack):
-        if index != 0:
-            resolved_style.inherited()
-        for id in value.split(" "):
-            if not id:
-                continue
-            properties = ctx.styles.get(id)
-            if properties is None:
-                raise ParseError("Invalid style id: {id}")
-            mask = resolved_style.merge_properties(properties)
-            resolved_style.compute(
-                mask=mask,
-                parent_font_size=parent_font_size,
-                cell_resolution=ctx.document.cell_resolution,
-            )
-            parent_font_size = resolved_style.font_size
+def _resolve_style(
+    style_stack: list[str], region_style: str, ctx: Context
+) -> model.ResolvedStyle:
+    # The region style applies below all other styles in the stack.
+    if region_style:
+        return _resolve_style_key((region_style, *style_stack), ctx)
+    return _resolve_style_key(tuple(style_stack), ctx)
+
+
+def _resolve_style_key(key: tuple[str, ...], ctx: Context) -> model.ResolvedStyle:
+    if (resolved_style := ctx.resolved_styles.get(key)) is None:
+        parent_style = _resolve_style_key(key[:-1], ctx)
+        resolved_style = parent_style.push(
+            _style_properties(key[-1], ctx), ctx.document.cell_resolution
+        )
+        ctx.resolved_styles[key] = resolved_style
     return resolved_style
 
 
-def _parse_body(root: ET.Element, ctx: Context) -> None:
-    body, count = functools.reduce(
-        lambda acc, elem: (elem, acc[1] + 1), root.iterfind(BODY_ELEM), (None, 0)
-    )
-    if body is None:
-        raise ParseError("Missing element `body`")
-    if count > 1:
-        raise ParseError("Multiple `body` elements")
-    style_stack = deque()
+@functools.lru_cache(maxsize=512)
+def _split_style_ids(value: str) -> tuple[str, ...]:
+    return tuple(sys.intern(v) for v in value.split(" ") if v)
+
+
+def _style_properties(
+    value: str, ctx: Context
+) -> list[tuple[model.StyleProperties, int]]:
+    styles = []
+    for id in _split_style_ids(value):
+        style = ctx.styles.get(id)
+        if style is None:
+            raise ParseError(f"Invalid style id: {id}")
+        styles.append(style)
+    return styles
+
+
+def _parse_body(body: ET.Element, events: Events, ctx: Context) -> None:
+    style_stack = []
     if value := body.get("style", "").strip():
         style_stack.append(value)
-    resolved_style = _resolve_style(style_stack, ctx)
+    resolved_style = _resolve_style(style_stack, "", ctx)
     ctx.document.body.background_color = resolved_style.background_color
-    _parse_div(body, style_stack, ctx)
-
-
-def _parse_div(body: ET.Element, style_stack: deque[str], ctx: Context) -> None:
-    for elem in body:
-        if elem.tag != DIV_ELEM:
+    depth = 0
+    for event, elem in events:
+        if event == "end":
+            if depth == 0:
+                break
+            depth -= 1
             continue
-        if id := _parse_id(elem, required=False):
-            ctx.add_id(id)
-        region_index = -1
-        region_style = ""
-        if region_id := elem.get("region", "").strip():
-            if pair := ctx.regions.get(region_id):
-                region_index = pair[0]
-                region_style = pair[1]
-            else:
-                raise ParseError(f"Invalid region identifier: {region_id}")
-        if region_style:
-            style_stack.appendleft(region_style)
-        style = elem.get("style", "").strip()
-        if style:
-            style_stack.append(style)
-        background_color = _resolve_style(style_stack, ctx).background_color
-        language = elem.get(LANG_ATTR, "").strip()
-        div = model.Div(id=id, language=language, background_color=background_color)
-        ctx.document.body.divs.append(div)
-        _parse_para(elem, style_stack, region_index, ctx)
-        if style:
-            style_stack.pop()
-        if region_style:
-            style_stack.popleft()
+        if depth == 0 and elem.tag == DIV_ELEM:
+            _parse_div(elem, events, style_stack, ctx)
+            continue
+        depth += 1
     if not ctx.document.body.divs:
         raise ParseError("Missing element `div`")
 
 
-class Scanner:
-    def __init__(self, input: str) -> None:
-        self.input = input
-
-    def scan_char(self, c: str) -> None:
-        if self.input and self.input[0] == c:
-            self.input = self.input[1:]
+def _parse_div(
+    elem: ET.Element, events: Events, style_stack: list[str], ctx: Context
+) -> None:
+    # Most elements carry no id, so only call into _parse_id when one is set.
+    if id := elem.get(ID_ATTR, ""):
+        id = _parse_id(elem)
+        ctx.add_id(id)
+    region_index = -1
+    region_style = ""
+    if region_id := elem.get("region", "").strip():
+        if pair := ctx.regions.get(region_id):
+            region_index = pair[0]
+            region_style = pair[1]
         else:
-            raise ValueError()
-
-    def scan_int(self, num_digits: int = 0, limit: int = 0) -> int:
-        count = 0
-        for c in self.input:
-            if c.isascii() and c.isdecimal():
-                count += 1
-            else:
-                break
-        if count == 0 or (num_digits > 0 and count != num_digits):
-            raise ValueError()
-        n = int(self.input[:count])
-        if limit > 0 and n > limit:
-            raise ValueError()
-        self.input = self.input[count:]
-        return n
+            raise ParseError(f"Invalid region identifier: {region_id}")
+    style = elem.get("style", "").strip()
+    if style:
+        style_stack.append(style)
+    background_color = _resolve_style(style_stack, region_style, ctx).background_color
+    language = elem.get(LANG_ATTR, "").strip()
+    div = model.Div(id=id, language=language, background_color=background_color)
+    ctx.document.body.divs.append(div)
+    # Paragraphs are handled on their start event and their br and span
+    # children on their end events, so the div content is walked in one pass.
+    paragraphs = div.paragraphs
+    para = None
+    para_region_style = ""
+    para_stack_size = 0
+    depth = 0
+    for event, child in events:
+        if event == "start":
+            depth += 1
+            if depth == 1 and child.tag == P_ELEM:
+                para_stack_size = len(style_stack)
+                para, para_region_style = _parse_para(
+                    child, style_stack, region_index, region_style, ctx
+                )
+                paragraphs.append(para)
+            continue
+        if depth == 0:
+            break
+        if depth == 1:
+            if para is not None:
+                del style_stack[para_stack_size:]
+                para = None
+            child.clear()
+        elif depth == 2 and para is not None:
+            tag = child.tag
+            if tag == SPAN_ELEM:
+                span = _parse_span(child, style_stack, para_region_style, ctx)
+                para.contents.append(span)
+            elif tag == BR_ELEM:
+                para.contents.append(model.Br())
+        depth -= 1
+    elem.clear()
+    if style:
+        style_stack.pop()
+    if not paragraphs:
+        raise ParseError("Missing element `p`")
 
 
 def _parse_timecode(attr: str, input: str) -> float:
-    scanner = Scanner(input)
-    try:
-        secs = scanner.scan_int() * 3600.0
-        scanner.scan_char(":")
-        secs += scanner.scan_int(num_digits=2, limit=59) * 60.0
-        scanner.scan_char(":")
-        secs += scanner.scan_int(num_digits=2, limit=59)
-        scanner.scan_char(".")
-        secs += scanner.scan_int(num_digits=3) * 0.001
-    except ValueError:
-        raise ParseError(f"Invalid `{attr}` attribute value: {input}")
-    if scanner.input:
+    if (m := TIMECODE_RE.fullmatch(input)) is None:
         raise ParseError(f"Invalid `{attr}` attribute value: {input}")
-    return secs
+    hours, minutes, seconds, millis = m.groups()
+    return (
+        int(hours) * 3600.0 + int(minutes) * 60.0 + int(seconds) + int(millis) * 0.001
+    )
 
 
 def _parse_para(
-    div: ET.Element, style_stack: deque[str], parent_region_index: int, ctx: Context
-) -> None:
-    paragraphs = ctx.document.body.divs[-1].paragraphs
-    for elem in div:
-        if elem.tag != P_ELEM:
-            continue
-        id = _parse_id(elem, required=True)
-        ctx.add_id(id)
-        if v := elem.get("begin"):
-            begin = _parse_timecode("begin", v.strip())
-        else:
-            raise ParseError("Missing `begin` attribute")
-        if v := elem.get("end"):
-            end = _parse_timecode("end", v.strip())
+    elem: ET.Element,
+    style_stack: list[str],
+    parent_region_index: int,
+    parent_region_style: str,
+    ctx: Context,
+) -> tuple[model.Paragraph, str]:
+    id = _parse_id(elem, required=True)
+    ctx.add_id(id)
+    if v := elem.get("begin"):
+        begin = _parse_timecode("begin", v.strip())
+    else:
+        raise ParseError("Missing `begin` attribute")
+    if v := elem.get("end"):
+        end = _parse_timecode("end", v.strip())
+    else:
+        raise ParseError("Missing `end` attribute")
+    region_index = -1
+    region_style = ""
+    if region_id := elem.get("region", "").strip():
+        if pair := ctx.regions.get(region_id):
+            region_index = pair[0]
+            region_style = pair[1]
         else:
-            raise ParseError("Missing `end` attribute")
-        region_index = -1
-        region_style = ""
-        if region_id := elem.get("region", "").strip():
-            if pair := ctx.regions.get(region_id):
-                region_index = pair[0]
-                region_style = pair[1]
-            else:
-                raise ParseError(f"Invalid region identifier: {region_id}")
-        if region_index != -1 and parent_region_index != -1:
-            raise ParseError("Multiple regions")
-        if region_index == -1:
-            if parent_region_index == -1:
-                raise ParseError("Missing `region` attribute")
-            region_index = parent_region_index
-        if region_style:
-            style_stack.appendleft(region_style)
-        style = elem.get("style", "").strip()
-        if style:
-            style_stack.append(style)
-        resolved_style = _resolve_style(style_stack, ctx)
-        language = elem.get(LANG_ATTR, "").strip()
-        space = model.Space.DEFAULT
-        if v := elem.get(SPACE_ATTR):
-            space = model.Space.parse(v)
-        para = model.Paragraph(
-            id=id,
-            begin_secs=begin,
-            end_secs=end,
-            region_index=region_index,
-            language=language,
-            space=space,
-            background_color=resolved_style.background_color,
-            direction=resolved_style.direction,
-            fill_line_gap=resolved_style.fill_line_gap,
-            line_height=resolved_style.line_height,
-            line_padding=resolved_style.line_padding,
-            multi_row_align=resolved_style.multi_row_align,
-            text_align=resolved_style.text_align,
-            unicode_bidi=resolved_style.unicode_bidi,
-        )
-        paragraphs.append(para)
-        _parse_paragraph_content(elem, style_stack, ctx)
-        if style:
-            style_stack.pop()
-        if region_style:
-            style_stack.popleft()
-    if not paragraphs:
-        raise ParseError("Missing element `p`")
+            raise ParseError(f"Invalid region identifier: {region_id}")
+    if region_index != -1 and parent_region_index != -1:
+        raise ParseError("Multiple regions")
+    if region_index == -1:
+        if parent_region_index == -1:
+            raise ParseError("Missing `region` attribute")
+        region_index = parent_region_index
+        region_style = parent_region_style
+    # The caller pops the paragraph style once the paragraph ends.
+    if style := elem.get("style", "").strip():
+        style_stack.append(style)
+    resolved_style = _resolve_style(style_stack, region_style, ctx)
+    language = elem.get(LANG_ATTR, "").strip()
+    space = model.Space.DEFAULT
+    if v := elem.get(SPACE_ATTR):
+        space = model.Space.parse(v)
+    para = model.Paragraph(
+        id=id,
+        begin_secs=begin,
+        end_secs=end,
+        region_index=region_index,
+        language=language,
+        space=space,
+        background_color=resolved_style.background_color,
+        direction=resolved_style.direction,
+        fill_line_gap=resolved_style.fill_line_gap,
+        line_height=resolved_style.line_height,
+        line_padding=resolved_style.line_padding,
+        multi_row_align=resolved_style.multi_row_align,
+        text_align=resolved_style.text_align,
+        unicode_bidi=resolved_style.unicode_bidi,
+    )
+    return para, region_style
 
 
-def _parse_paragraph_content(para: ET.Element, style_stack: deque[str], ctx: Context):
-    contents = ctx.document.body.divs[-1].paragraphs[-1].contents
-    for elem in para:
-        if elem.tag == BR_ELEM:
-            contents.append(model.Br())
-            continue
-        if elem.tag != SPAN_ELEM:
-            continue
-        if id := _parse_id(elem, required=False):
-            ctx.add_id(id)
-        style = elem.get("style", "").strip()
-        if style:
-            style_stack.append(style)
-        resolved_style = _resolve_style(style_stack, ctx)
-        language = elem.get(LANG_ATTR, "").strip()
-        space = model.Space.DEFAULT
-        if v := elem.get(SPACE_ATTR):
-            space = model.Space.parse(v)
-        span = model.Span(
-            id=id,
-            language=language,
-            space=space,
-            background_color=resolved_style.background_color,
-            color=resolved_style.color,
-            direction=resolved_style.direction,
-            font_family=resolved_style.font_family,
-            font_size=resolved_style.font_size,
-            font_style=resolved_style.font_style,
-            font_weight=resolved_style.font_weight,
-            text_decoration=resolved_style.text_decoration,
-            text_outline=resolved_style.text_outline,
-            unicode_bidi=resolved_style.unicode_bidi,
-            wrap_option=resolved_style.wrap_option,
-            text=elem.text or "",
-        )
-        contents.append(span)
-        if style:
-            style_stack.pop()
+def _parse_span(
+    elem: ET.Element, style_stack: list[str], region_style: str, ctx: Context
+) -> model.Span:
+    if id := elem.get(ID_ATTR, ""):
+        id = _parse_id(elem)
+        ctx.add_id(id)
+    style = elem.get("style", "").strip()
+    if style:
+        style_stack.append(style)
+    resolved_style = _resolve_style(style_stack, region_style, ctx)
+    if style:
+        style_stack.pop()
+    language = elem.get(LANG_ATTR, "").strip()
+    space = model.Space.DEFAULT
+    if v := elem.get(SPACE_ATTR):
+        space = model.Space.parse(v)
+    return model.Span(
+        id=id,
+        language=language,
+        space=space,
+        background_color=resolved_style.background_color,
+        color=resolved_style.color,
+        direction=resolved_style.direction,
+        font_family=resolved_style.font_family,
+        font_size=resolved_style.font_size,
+        font_style=resolved_style.font_style,
+        font_weight=resolved_style.font_weight,
+        text_decoration=resolved_style.text_decoration,
+        text_outline=resolved_style.text_outline,
+        unicode_bidi=resolved_style.unicode_bidi,
+        wrap_option=resolved_style.wrap_option,
+        text=elem.text or "",
+    )
@@ -0,0 +1,114 @@
+import pytest
+
+from ebuttd import model, parse
+
+DOCUMENT = """\
+<tt xmlns="http://www.w3.org/ns/ttml"
+    xmlns:ttp="http://www.w3.org/ns/ttml#parameter"
+    xmlns:tts="http://www.w3.org/ns/ttml#styling"
+    xmlns:itts="http://www.w3.org/ns/ttml/profile/imsc1#styling"
+    ttp:timeBase="media" xml:lang="en">
+  <head>
+    <metadata/>
+    <styling>
+      <style xml:id="s0" itts:fillLineGap="true" tts:fontSize="150%"/>
+      <style xml:id="s1" itts:fillLineGap="false" tts:fontSize="0%"/>
+    </styling>
+    <layout>
+      <region xml:id="r0" tts:origin="10% 80%" tts:extent="80% 20%"/>
+    </layout>
+  </head>
+  <body style="s0">
+    <div xml:id="d0" region="r0">
+      <p xml:id="p0" begin="00:00:01.000" end="00:00:02.000">
+        <span xml:id="sp0">Hello</span><br/><span>World</span>
+      </p>
+      <p xml:id="p1" begin="00:00:02.000" end="00:00:03.000" style="s1">
+        <span>Bye</span>
+      </p>
+    </div>
+  </body>
+</tt>
+"""
+
+SPAN = '<span xml:id="sp0">Hello</span>'
+
+BACKENDS = [
+    pytest.param(False, id="stdlib"),
+    pytest.param(True, id="lxml"),
+]
+
+PARITY_CASES = {
+    "plain": DOCUMENT,
+    "comment": DOCUMENT.replace(SPAN, "<span>He<!-- c -->l<?pi x?>lo</span>"),
+    "cdata": DOCUMENT.replace(SPAN, "<span>He<![CDATA[l]]>lo</span>"),
+    "entity": '<!DOCTYPE tt [<!ENTITY e "Hello">]>\n'
+    + DOCUMENT.replace(SPAN, "<span>&e;</span>"),
+    "encoding": '<?xml version="1.0" encoding="ISO-8859-1"?>\n'
+    + DOCUMENT.replace(SPAN, "<span>Héllo</span>"),
+    "empty_id": DOCUMENT.replace('xml:id="sp0"', 'xml:id=""').replace(
+        'xml:id="d0"', 'xml:id=""'
+    ),
+    "invalid_id": DOCUMENT.replace('xml:id="sp0"', 'xml:id="1bad"'),
+    "skipped_duplicate_id": DOCUMENT.replace(
+        "<metadata/>", '<metadata><x xml:id="m"/><x xml:id="m"/></metadata>'
+    ),
+    "duplicate_id": DOCUMENT.replace('xml:id="sp0"', 'xml:id="p0"'),
+}
+
+
+BR = model.Br()
+
+
+def _parse(input: str, use_lxml: bool) -> model.Document | str:
+    try:
+        document = parse.parse(input, use_lxml=use_lxml)
+    except parse.ParseError as e:
+        return str(e)
+    # Br has no equality, so replace it with a shared instance.
+    for div in document.body.divs:
+        for para in div.paragraphs:
+            para.contents = [
+                BR if isinstance(c, model.Br) else c for c in para.contents
+            ]
+    return document
+
+
+@pytest.mark.parametrize("input", PARITY_CASES.values(), ids=PARITY_CASES.keys())
+def test_backend_parity(input: str) -> None:
+    pytest.importorskip("lxml")
+    assert _parse(input, False) == _parse(input, True)
+
+
+@pytest.mark.parametrize("use_lxml", BACKENDS)
+def test_span_text_spans_comments(use_lxml: bool) -> None:
+    if use_lxml:
+        pytest.importorskip("lxml")
+    document = _parse(PARITY_CASES["comment"], use_lxml)
+    assert document.body.divs[0].paragraphs[0].contents[0].text == "Hello"
+
+
+@pytest.mark.parametrize("use_lxml", BACKENDS)
+def test_use_lxml_flag(monkeypatch: pytest.MonkeyPatch, use_lxml: bool) -> None:
+    if use_lxml:
+        pytest.importorskip("lxml")
+    calls = []
+    for name in ("_iterparse", "_lxml_iterparse"):
+        f = getattr(parse, name)
+        monkeypatch.setattr(
+            parse, name, lambda input, name=name, f=f: calls.append(name) or f(input)
+        )
+    monkeypatch.setattr(parse, "USE_LXML", use_lxml)
+    parse.parse(DOCUMENT)
+    assert calls == ["_lxml_iterparse" if use_lxml else "_iterparse"]
+
+
+@pytest.mark.parametrize("use_lxml", BACKENDS)
+def test_explicit_false_and_zero_override_inherited(use_lxml: bool) -> None:
+    if use_lxml:
+        pytest.importorskip("lxml")
+    p0, p1 = _parse(DOCUMENT, use_lxml).body.divs[0].paragraphs
+    assert p0.fill_line_gap is True
+    assert p0.contents[0].font_size > 0.0
+    assert p1.fill_line_gap is False
+    assert p1.contents[0].font_size == 0.0